@@ -12,8 +12,9 @@ $1,000 monthly contributions, 10-year horizon.
 """
 
 from src.data import get_all_prices
-from src.simulator import simulate_dca, run_rolling_windows
-from src.analysis import summarize, rolling_summary
+from src.simulator import simulate_dca
+from src.analysis import summarize
+from src.incremental import update_rolling_summary
 from src.visualize import (
     plot_growth_comparison,
     plot_rolling_returns,
@@ -55,9 +56,8 @@ def main():
     for label, prices in all_prices.items():
         if len(prices) < WINDOW_MONTHS:
             continue
-        windows = run_rolling_windows(prices, MONTHLY_CONTRIBUTION, WINDOW_MONTHS)
-        all_rolling[label] = rolling_summary(windows, label)
-        print(f"  {label:<25} {len(all_rolling[label])} windows")
+        all_rolling[label], n_updated = update_rolling_summary(label, prices, WINDOW_MONTHS, MONTHLY_CONTRIBUTION)
+        print(f"  {label:<25} {len(all_rolling[label])} windows ({n_updated} new or revised)")
 
     # Align to common date range for fair comparison
     common_starts = None
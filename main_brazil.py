@@ -7,8 +7,9 @@ R$1,000 monthly contributions, 10-year horizon.
 """
 
 from src.data_brazil import get_bova11_prices, get_divo11_prices, get_ivvb11_prices, get_gold11_prices, get_btc_brl_prices, get_cdi_monthly_factors, simulate_cdi
-from src.simulator import simulate_dca, run_rolling_windows
-from src.analysis import summarize, rolling_summary
+from src.simulator import simulate_dca
+from src.analysis import summarize
+from src.incremental import update_rolling_summary
 from src.visualize import (
     plot_growth_comparison,
     plot_rolling_returns,
@@ -20,19 +21,6 @@ MONTHLY_CONTRIBUTION = 1000.0
 WINDOW_MONTHS = 120  # 10 years
 
 
-def run_cdi_rolling_windows(monthly_factors, monthly_contribution, window_months):
-    """Run CDI simulation for every possible rolling window."""
-    results = []
-    max_start = len(monthly_factors) - window_months
-
-    for start in range(max_start + 1):
-        window = monthly_factors.iloc[start : start + window_months].reset_index(drop=True)
-        sim = simulate_cdi(window, monthly_contribution, window_months)
-        results.append(sim)
-
-    return results
-
-
 def main():
     print("Downloading Brazilian price data...")
     bova11_prices = get_bova11_prices()
@@ -115,13 +103,14 @@ def main():
     for label, prices in equity_data.items():
         if len(prices) < WINDOW_MONTHS:
             continue
-        windows = run_rolling_windows(prices, MONTHLY_CONTRIBUTION, WINDOW_MONTHS)
-        all_rolling[label] = rolling_summary(windows, label)
-        print(f"  {label:<15} {len(all_rolling[label])} windows")
+        all_rolling[label], n_updated = update_rolling_summary(label, prices, WINDOW_MONTHS, MONTHLY_CONTRIBUTION)
+        print(f"  {label:<15} {len(all_rolling[label])} windows ({n_updated} new or revised)")
 
-    cdi_windows = run_cdi_rolling_windows(cdi_factors, MONTHLY_CONTRIBUTION, WINDOW_MONTHS)
-    all_rolling["100% CDI"] = rolling_summary(cdi_windows, "100% CDI")
-    print(f"  {'100% CDI':<15} {len(all_rolling['100% CDI'])} windows")
+    cdi_series = cdi_factors.set_index(cdi_factors["month"].dt.to_timestamp())["monthly_factor"]
+    all_rolling["100% CDI"], n_updated = update_rolling_summary(
+        "100% CDI", cdi_series, WINDOW_MONTHS, MONTHLY_CONTRIBUTION, kind="factor"
+    )
+    print(f"  {'100% CDI':<15} {len(all_rolling['100% CDI'])} windows ({n_updated} new or revised)")
 
     # Align to common date range
     common_starts = None
@@ -97,3 +97,69 @@ def rolling_summary(windows: list[pd.DataFrame], label: str) -> pd.DataFrame:
     """Summarize all rolling windows into a DataFrame."""
     summaries = [summarize(w, label) for w in windows]
     return pd.DataFrame(summaries)
+
+
+def summarize_windows(
+    dates: pd.DatetimeIndex,
+    invested: np.ndarray,
+    values: np.ndarray,
+    label: str,
+    risk_free_annual: float = 0.03,
+) -> pd.DataFrame:
+    """
+    Vectorized equivalent of rolling_summary for stacked window paths.
+
+    Args:
+        dates: Dates of the full series; window i covers dates[i : i + months].
+        invested: Total invested per window and month, shape (n_windows, months).
+        values: Portfolio value per window and month, shape (n_windows, months).
+        label: Strategy label.
+        risk_free_annual: Risk-free rate for the Sharpe ratio, as in sharpe_ratio().
+
+    Returns:
+        DataFrame with the same columns as rolling_summary().
+    """
+    n_windows, n_months = values.shape
+    final = values[:, -1]
+    final_invested = invested[:, -1]
+
+    gain = final - final_invested
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return_pct = gain / final_invested * 100
+
+    avg_years = n_months / 12 / 2
+    cagr_pct = np.zeros(n_windows)
+    if avg_years > 0:
+        ok = final_invested > 0
+        cagr_pct[ok] = ((final[ok] / final_invested[ok]) ** (1 / avg_years) - 1) * 100
+
+    peak = np.maximum.accumulate(values, axis=1)
+    # Months before the first contribution have no peak and no drawdown
+    drawdown = np.divide(peak - values, peak, out=np.zeros_like(values), where=peak > 0)
+    drawdown_pct = (drawdown * 100).max(axis=1).clip(min=0)
+
+    # Month-over-month returns net of each month's contribution
+    contributions = np.diff(invested, axis=1)
+    prev = values[:, :-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rets = np.where(prev > 0, (values[:, 1:] - prev - contributions) / prev, 0.0)
+    rf_monthly = (1 + risk_free_annual) ** (1 / 12) - 1
+    excess = rets - rf_monthly
+    std = rets.std(axis=1, ddof=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.where(
+            std == 0, 0.0, excess.mean(axis=1) / excess.std(axis=1, ddof=1) * np.sqrt(12)
+        )
+
+    return pd.DataFrame({
+        "strategy": label,
+        "start_date": dates[:n_windows].strftime("%Y-%m"),
+        "end_date": dates[n_months - 1 : n_months - 1 + n_windows].strftime("%Y-%m"),
+        "total_invested": final_invested,
+        "final_value": final,
+        "total_return": gain,
+        "total_return_pct": np.round(return_pct, 2),
+        "cagr_pct": np.round(cagr_pct, 2),
+        "max_drawdown_pct": np.round(drawdown_pct, 2),
+        "sharpe_ratio": np.round(sharpe, 2),
+    })
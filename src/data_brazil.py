@@ -1,10 +1,12 @@
 import os
 import json
 import urllib.request
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 
 from src.data import download_monthly_prices
+from src.simulator import contribution_vector
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
 
@@ -41,10 +43,23 @@ def get_btc_brl_prices(start: str = "2010-01-01") -> pd.Series:
     return btc_brl
 
 
-def _fetch_cdi_daily() -> pd.DataFrame:
-    """Fetch daily CDI rates from Banco Central do Brasil SGS API."""
+# Banco Central do Brasil SGS series for rate-linked products
+BCB_SERIES = {
+    "CDI": {"code": 12, "frequency": "daily", "start_year": 2000},
+    "SELIC": {"code": 11, "frequency": "daily", "start_year": 2000},
+    "IPCA": {"code": 433, "frequency": "monthly", "start_year": 1995},
+}
+
+
+def _fetch_bcb_series(index: str) -> pd.DataFrame:
+    """
+    Fetch a rate series from Banco Central do Brasil SGS API, caching to CSV.
+
+    Returns DataFrame with columns: date, rate (in % per period).
+    """
+    series = BCB_SERIES[index]
     os.makedirs(DATA_DIR, exist_ok=True)
-    cache_path = os.path.join(DATA_DIR, "CDI_daily.csv")
+    cache_path = os.path.join(DATA_DIR, f"{index}_{series['frequency']}.csv")
 
     if os.path.exists(cache_path):
         df = pd.read_csv(cache_path, parse_dates=["date"])
@@ -53,23 +68,23 @@ def _fetch_cdi_daily() -> pd.DataFrame:
     from urllib.parse import quote
     from datetime import datetime
 
-    print("  Fetching CDI data from BCB API...")
+    print(f"  Fetching {index} data from BCB API...")
     all_records = []
     current_year = datetime.now().year
 
     import time
 
-    for year in range(2000, current_year + 1):
+    for year in range(series["start_year"], current_year + 1):
         start = quote(f"01/01/{year}")
         end = quote(f"31/12/{year}")
-        url = f"https://api.bcb.gov.br/dados/serie/bcdata.sgs.12/dados?formato=json&dataInicial={start}&dataFinal={end}"
+        url = f"https://api.bcb.gov.br/dados/serie/bcdata.sgs.{series['code']}/dados?formato=json&dataInicial={start}&dataFinal={end}"
         req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0", "Accept": "*/*"})
         for attempt in range(3):
             try:
                 with urllib.request.urlopen(req, timeout=30) as resp:
                     records = json.loads(resp.read().decode("utf-8"))
                     all_records.extend(records)
-                print(f"    {year}: {len(records)} days")
+                print(f"    {year}: {len(records)} records")
                 break
             except urllib.error.HTTPError:
                 if attempt < 2:
@@ -87,6 +102,36 @@ def _fetch_cdi_daily() -> pd.DataFrame:
     return df
 
 
+def _fetch_cdi_daily() -> pd.DataFrame:
+    """Fetch daily CDI rates from Banco Central do Brasil SGS API."""
+    return _fetch_bcb_series("CDI")
+
+
+@lru_cache(maxsize=None)
+def get_grouped_rates(index: str) -> tuple[pd.PeriodIndex, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Load a BCB rate series once and group it by calendar month.
+
+    Returns (months, rates, month_starts, periods_per_month) where rates are
+    decimal per-period rates sorted by date, and month_starts are the offsets
+    of each month's first row (suitable for np.add.reduceat). Results are
+    cached for the lifetime of the process; the arrays are read-only.
+    """
+    df = _fetch_bcb_series(index).sort_values("date")
+    rates = df["rate"].to_numpy(dtype=float) / 100
+    periods = df["date"].dt.to_period("M").to_numpy()
+
+    is_new_month = np.ones(len(periods), dtype=bool)
+    is_new_month[1:] = periods[1:] != periods[:-1]
+    month_starts = np.flatnonzero(is_new_month)
+    periods_per_month = np.diff(np.append(month_starts, len(periods)))
+    months = pd.PeriodIndex(periods[month_starts], freq="M")
+
+    for arr in (rates, month_starts, periods_per_month):
+        arr.setflags(write=False)
+    return months, rates, month_starts, periods_per_month
+
+
 def get_cdi_monthly_factors() -> pd.DataFrame:
     """
     Convert daily CDI rates to monthly compounded factors.
@@ -94,25 +139,27 @@ def get_cdi_monthly_factors() -> pd.DataFrame:
     Returns DataFrame with columns: month (Period), monthly_factor
     where monthly_factor = product of (1 + daily_rate/100) for all days in that month.
     """
-    daily = _fetch_cdi_daily()
-
     # Daily CDI rate is already the effective daily rate in %
-    daily["daily_factor"] = 1 + daily["rate"] / 100
-    daily["month"] = daily["date"].dt.to_period("M")
+    months, rates, month_starts, _ = get_grouped_rates("CDI")
+    monthly_factor = np.exp(np.add.reduceat(np.log1p(rates), month_starts))
+    return pd.DataFrame({"month": months, "monthly_factor": monthly_factor})
+
 
-    monthly = daily.groupby("month")["daily_factor"].prod().reset_index()
-    monthly.columns = ["month", "monthly_factor"]
-    return monthly
+def get_ipca_monthly_rates() -> pd.Series:
+    """Monthly IPCA inflation as decimal rates indexed by month (Period)."""
+    months, rates, _, _ = get_grouped_rates("IPCA")
+    return pd.Series(rates, index=months, name="ipca")
 
 
 def simulate_cdi(
     monthly_factors: pd.DataFrame,
-    monthly_contribution: float = 1000.0,
+    monthly_contribution: float | np.ndarray = 1000.0,
     months: int = 120,
 ) -> pd.DataFrame:
     """
     Simulate investing monthly_contribution each month at 100% CDI.
 
+    monthly_contribution may also be a schedule with one amount per month.
     Each deposit compounds at CDI rates from its deposit month onward.
     Returns DataFrame matching simulate_dca() output format.
     """
@@ -123,30 +170,20 @@ def simulate_cdi(
             f"CDI data has {len(factors)} months, need at least {months}"
         )
 
-    records = []
-    # Track each deposit and its accumulated value
-    deposits = []  # list of current values for each past deposit
-
-    for i, row in factors.iterrows():
-        month = row["month"]
-        factor = row["monthly_factor"]
-
-        # Compound all existing deposits by this month's factor
-        deposits = [d * factor for d in deposits]
-
-        # Add new deposit (it earns this month's rate too)
-        deposits.append(monthly_contribution * factor)
-
-        total_invested = monthly_contribution * (i + 1)
-        portfolio_value = sum(deposits)
-
-        records.append({
-            "date": month.to_timestamp(),
-            "price": np.nan,
-            "shares_bought": np.nan,
-            "total_shares": np.nan,
-            "total_invested": total_invested,
-            "portfolio_value": portfolio_value,
-        })
-
-    return pd.DataFrame(records)
+    contributions = contribution_vector(monthly_contribution, months)
+
+    # growth[t] = value at the end of month t of 1 deposited before month 0;
+    # a deposit in month j (which earns that month's rate too) grows by
+    # growth[t] / growth[j - 1]
+    growth = np.cumprod(factors["monthly_factor"].to_numpy(dtype=float))
+    growth_before = np.concatenate([[1.0], growth[:-1]])
+    portfolio_value = growth * np.cumsum(contributions / growth_before)
+
+    return pd.DataFrame({
+        "date": factors["month"].dt.to_timestamp(),
+        "price": np.nan,
+        "shares_bought": np.nan,
+        "total_shares": np.nan,
+        "total_invested": np.cumsum(contributions),
+        "portfolio_value": portfolio_value,
+    })
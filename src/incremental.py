@@ -0,0 +1,135 @@
+import os
+import re
+import json
+import hashlib
+import pandas as pd
+import numpy as np
+
+from src.analysis import summarize_windows
+from src.simulator import simulate_dca_windows
+from src.rates import simulate_rate_windows
+
+STATE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "rolling")
+
+
+def _simulate_factor_windows(factors: pd.Series, monthly_contribution, window_months: int):
+    """simulate_rate_windows() for a single series of monthly growth factors."""
+    log_factors = np.log(factors.to_numpy(dtype=float))[:, None]
+    invested, values = simulate_rate_windows(log_factors, monthly_contribution, window_months)
+    return invested, values[..., 0]
+
+
+# How to simulate every rolling window for each kind of input series
+WINDOW_SIMULATORS = {
+    "price": simulate_dca_windows,
+    "factor": _simulate_factor_windows,
+}
+
+
+def _state_paths(label: str, window_months: int) -> tuple[str, str, str]:
+    """Paths of the summary, input series and metadata files for a label."""
+    # The readable part can collide ("100% CDI" vs "100 CDI"); the hash keeps them apart
+    digest = hashlib.sha1(label.encode("utf-8")).hexdigest()[:8]
+    key = re.sub(r"[^A-Za-z0-9.=-]+", "_", label).strip("_") + f"_{digest}"
+    base = os.path.join(STATE_DIR, f"{key}_{window_months}m")
+    return f"{base}_rolling.csv", f"{base}_input.csv", f"{base}_meta.json"
+
+
+def load_rolling_state(label: str, window_months: int = 120):
+    """
+    Load the stored rolling state for a label and horizon.
+
+    Returns (summary, series, meta), or (None, None, None) if nothing is stored.
+    """
+    summary_path, input_path, meta_path = _state_paths(label, window_months)
+    if not all(os.path.exists(p) for p in (summary_path, input_path, meta_path)):
+        return None, None, None
+
+    summary = pd.read_csv(summary_path, float_precision="round_trip")
+    series = pd.read_csv(input_path, index_col=0, parse_dates=True, float_precision="round_trip")["value"]
+    with open(meta_path) as f:
+        meta = json.load(f)
+    return summary, series, meta
+
+
+def save_rolling_state(
+    label: str,
+    window_months: int,
+    summary: pd.DataFrame,
+    series: pd.Series,
+    meta: dict,
+):
+    """Persist the rolling summary with the input series it was computed from."""
+    os.makedirs(STATE_DIR, exist_ok=True)
+    summary_path, input_path, meta_path = _state_paths(label, window_months)
+
+    summary.to_csv(summary_path, index=False)
+    pd.DataFrame({"value": series.to_numpy()}, index=pd.Index(series.index, name="date")).to_csv(input_path)
+    with open(meta_path, "w") as f:
+        json.dump(meta, f, indent=2)
+
+
+def first_changed_month(old: pd.Series, new: pd.Series) -> int:
+    """
+    Position of the first month where new differs from old.
+
+    Compares dates and values over the overlapping range; returns the length
+    of the overlap when one series is a prefix of the other.
+    """
+    n = min(len(old), len(new))
+    same_dates = old.index[:n] == new.index[:n]
+    same_values = np.isclose(old.to_numpy(dtype=float)[:n], new.to_numpy(dtype=float)[:n], rtol=1e-12, atol=0)
+    changed = np.flatnonzero(~(same_dates & same_values))
+    return int(changed[0]) if len(changed) else n
+
+
+def update_rolling_summary(
+    label: str,
+    series: pd.Series,
+    window_months: int = 120,
+    monthly_contribution: float = 1000.0,
+    kind: str = "price",
+) -> tuple[pd.DataFrame, int]:
+    """
+    Bring the stored rolling summary for label up to date with series.
+
+    Only windows that include a new or revised month are simulated; windows
+    ending before the first change are reused from the stored state. A
+    change of label, contribution or series kind recomputes everything.
+
+    Args:
+        label: Strategy label, also used to name the state files.
+        series: Monthly prices (kind="price") or monthly growth factors
+            (kind="factor"), indexed by date.
+        window_months: Number of months per window.
+        monthly_contribution: Amount invested each month.
+        kind: Key of WINDOW_SIMULATORS.
+
+    Returns:
+        (summary, n_updated): the full rolling summary, matching
+        rolling_summary(), and the number of windows recomputed.
+    """
+    if len(series) < window_months:
+        raise ValueError(
+            f"Series has {len(series)} months, need at least {window_months}"
+        )
+
+    meta = {"label": label, "kind": kind, "monthly_contribution": float(monthly_contribution)}
+    stored, stored_series, stored_meta = load_rolling_state(label, window_months)
+
+    first_start = 0
+    if stored is not None and stored_meta == meta:
+        # A window starting at s covers months s .. s + window_months - 1
+        first_start = max(first_changed_month(stored_series, series) - window_months + 1, 0)
+
+    kept = stored.iloc[:first_start] if first_start else None
+    tail = series.iloc[first_start:]
+    if len(tail) >= window_months:
+        invested, values = WINDOW_SIMULATORS[kind](tail, monthly_contribution, window_months)
+        updated = summarize_windows(tail.index, invested, values, label)
+    else:
+        updated = kept.iloc[:0]
+
+    summary = pd.concat([kept, updated], ignore_index=True) if kept is not None else updated
+    save_rolling_state(label, window_months, summary, series, meta)
+    return summary, len(updated)
@@ -0,0 +1,193 @@
+from functools import lru_cache
+from itertools import product
+
+import pandas as pd
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.data_brazil import BCB_SERIES, get_grouped_rates
+from src.analysis import summarize_windows
+from src.simulator import contribution_matrix
+
+# Compounding periods per year for the annual spread of each series frequency
+PERIODS_PER_YEAR = {"daily": 252, "monthly": 12}
+
+
+def rate_product(index: str, multiplier: float = 1.0, spread: float = 0.0) -> dict:
+    """
+    Describe a rate-linked fixed income product.
+
+    Args:
+        index: BCB series name ("CDI", "SELIC" or "IPCA").
+        multiplier: Fraction of the index paid, e.g. 1.1 for 110% CDI.
+        spread: Annual rate paid on top of the index, e.g. 0.06 for IPCA + 6%.
+
+    Returns:
+        Dict with keys: label, index, multiplier, spread.
+    """
+    if index not in BCB_SERIES:
+        raise ValueError(f"Unknown rate index {index!r}, expected one of {list(BCB_SERIES)}")
+
+    # Inflation products are quoted as "IPCA + x%", rate products as "110% CDI"
+    label = "IPCA" if index == "IPCA" and multiplier == 1.0 else f"{multiplier * 100:g}% {index}"
+    if spread:
+        label += f" + {spread * 100:g}%"
+
+    return {"label": label, "index": index, "multiplier": multiplier, "spread": spread}
+
+
+def product_grid(index: str, multipliers=(1.0,), spreads=(0.0,)) -> list[dict]:
+    """Build one product per (multiplier, spread) combination on a single index."""
+    return [rate_product(index, m, s) for m, s in product(multipliers, spreads)]
+
+
+@lru_cache(maxsize=None)
+def _monthly_log_factors(index: str, multipliers: tuple, spreads: tuple) -> np.ndarray:
+    """Log monthly growth factors, shape (n_months, n_products). Cached and read-only."""
+    _, rates, month_starts, periods_per_month = get_grouped_rates(index)
+    mult = np.asarray(multipliers, dtype=float)
+    spread = np.asarray(spreads, dtype=float)
+
+    # Each period pays multiplier * index rate; the spread compounds per period
+    log_index = np.add.reduceat(np.log1p(rates[:, None] * mult[None, :]), month_starts, axis=0)
+    periods_per_year = PERIODS_PER_YEAR[BCB_SERIES[index]["frequency"]]
+    log_spread = periods_per_month[:, None] * np.log1p(spread)[None, :] / periods_per_year
+
+    log_factors = log_index + log_spread
+    log_factors.setflags(write=False)
+    return log_factors
+
+
+def _log_factor_matrix(products: list[dict]) -> tuple[pd.PeriodIndex, np.ndarray]:
+    """Months and log monthly growth factors for products sharing one index."""
+    indices = {p["index"] for p in products}
+    if len(indices) != 1:
+        raise ValueError(f"Products must share one index, got {sorted(indices)}")
+
+    index = indices.pop()
+    months = get_grouped_rates(index)[0]
+    log_factors = _monthly_log_factors(
+        index,
+        tuple(p["multiplier"] for p in products),
+        tuple(p["spread"] for p in products),
+    )
+    return months, log_factors
+
+
+def monthly_factor_matrix(products: list[dict]) -> tuple[pd.PeriodIndex, np.ndarray]:
+    """
+    Monthly growth factors for products sharing one index.
+
+    Returns (months, factors) where factors has shape (n_months, n_products).
+    """
+    months, log_factors = _log_factor_matrix(products)
+    return months, np.exp(log_factors)
+
+
+def product_monthly_factors(product_spec: dict) -> pd.DataFrame:
+    """Monthly factors for one product, in the format simulate_cdi() expects."""
+    months, factors = monthly_factor_matrix([product_spec])
+    return pd.DataFrame({"month": months, "monthly_factor": factors[:, 0]})
+
+
+def simulate_rate_windows(
+    log_factors: np.ndarray,
+    monthly_contribution: float | np.ndarray = 1000.0,
+    window_months: int = 120,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate monthly deposits into every rolling window for every product at once.
+
+    Each deposit earns its deposit month's rate and compounds afterwards,
+    matching simulate_cdi(). Values are a contribution-weighted cumulative
+    sum computed relative to each window's first month, so no per-month
+    loop is needed.
+
+    Args:
+        log_factors: Log monthly growth factors, shape (n_months, n_products).
+        monthly_contribution: Anything contribution_matrix() accepts; leading
+            axes evaluate several schedules in one pass.
+        window_months: Number of months per window.
+
+    Returns:
+        (invested, values): invested has shape (..., n_windows, window_months),
+        values has shape (..., n_windows, window_months, n_products).
+    """
+    n_months = log_factors.shape[0]
+    if n_months < window_months:
+        raise ValueError(
+            f"Rate data has {n_months} months, need at least {window_months}"
+        )
+
+    # cum_log[t] = log growth from the start of the series to the end of month t
+    cum_log = np.vstack([np.zeros((1, log_factors.shape[1])), np.cumsum(log_factors, axis=0)])
+
+    # Windows of log growth before each deposit (start of month) and at month end
+    before = sliding_window_view(cum_log[:-1], window_months, axis=0).transpose(0, 2, 1)
+    after = sliding_window_view(cum_log[1:], window_months, axis=0).transpose(0, 2, 1)
+    base = before[:, :1, :]
+
+    # Value at month t = sum over deposits j <= t of c_j * growth(j -> t)
+    contributions = contribution_matrix(monthly_contribution, before.shape[0], window_months)
+    deposits = np.cumsum(contributions[..., None] * np.exp(base - before), axis=-2)
+    values = np.exp(after - base) * deposits
+
+    return np.cumsum(contributions, axis=-1), values
+
+
+def rolling_rate_schedules(
+    products: list[dict],
+    schedules: dict[str, float | np.ndarray],
+    window_months: int = 120,
+) -> dict[str, dict[str, pd.DataFrame]]:
+    """
+    Rolling window summaries for every (schedule, product) pair in one batch.
+
+    Products are grouped by index and each group is evaluated in a single
+    batched computation. Per-window schedules (n_windows, window_months)
+    must match the month range of every index in products.
+
+    Returns {schedule label: {product label: rolling summary DataFrame}}.
+    """
+    labels = [p["label"] for p in products]
+    duplicates = sorted({label for label in labels if labels.count(label) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate product labels: {duplicates}")
+
+    by_index = {}
+    for p in products:
+        by_index.setdefault(p["index"], []).append(p)
+
+    results = {name: {} for name in schedules}
+    for group in by_index.values():
+        months, log_factors = _log_factor_matrix(group)
+        n_windows = max(len(months) - window_months + 1, 0)
+        stacked = np.stack([
+            contribution_matrix(schedule, n_windows, window_months)
+            for schedule in schedules.values()
+        ])
+        invested, values = simulate_rate_windows(log_factors, stacked, window_months)
+        dates = months.to_timestamp()
+        for i, name in enumerate(schedules):
+            for k, p in enumerate(group):
+                results[name][p["label"]] = summarize_windows(
+                    dates, invested[i], values[i, :, :, k], p["label"]
+                )
+
+    return {
+        name: {p["label"]: by_label[p["label"]] for p in products}
+        for name, by_label in results.items()
+    }
+
+
+def rolling_rate_summaries(
+    products: list[dict],
+    monthly_contribution: float | np.ndarray = 1000.0,
+    window_months: int = 120,
+) -> dict[str, pd.DataFrame]:
+    """
+    Rolling window summaries for a batch of rate-linked products.
+
+    Returns {label: rolling summary DataFrame}.
+    """
+    return rolling_rate_schedules(products, {"": monthly_contribution}, window_months)[""]
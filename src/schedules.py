@@ -0,0 +1,77 @@
+import pandas as pd
+import numpy as np
+
+
+def constant_schedule(amount: float = 1000.0, months: int = 120) -> np.ndarray:
+    """Invest the same amount every month."""
+    return np.full(months, amount, dtype=float)
+
+
+def annual_raise_schedule(
+    amount: float = 1000.0,
+    months: int = 120,
+    raise_pct: float = 5.0,
+) -> np.ndarray:
+    """Start at amount and raise the contribution by raise_pct every 12 months."""
+    years = np.arange(months) // 12
+    return amount * (1 + raise_pct / 100) ** years
+
+
+def inflation_indexed_schedule(
+    amount: float,
+    inflation: pd.Series,
+    dates: pd.Index,
+    window_months: int = 120,
+    every: int = 12,
+) -> np.ndarray:
+    """
+    Contributions corrected by inflation, for every rolling window over dates.
+
+    The contribution starts at amount in each window's first month and is
+    readjusted every `every` months by the inflation accumulated since the
+    window started (every=1 indexes monthly).
+
+    Args:
+        inflation: Monthly inflation as decimal rates indexed by month (Period),
+            e.g. get_ipca_monthly_rates().
+        dates: Monthly dates of the asset being simulated.
+        window_months: Number of months per window.
+        every: Readjustment interval in months.
+
+    Returns:
+        Array of shape (n_windows, window_months), one schedule per window.
+    """
+    periods = dates if isinstance(dates, pd.PeriodIndex) else pd.DatetimeIndex(dates).to_period("M")
+    n_windows = len(periods) - window_months + 1
+    if n_windows < 1:
+        raise ValueError(
+            f"Series has {len(periods)} months, need at least {window_months}"
+        )
+
+    # Only months before each window's last adjustment feed a correction, so
+    # the trailing months (usually not yet published) are not required
+    last_adjustment = np.arange(window_months) // every * every
+    needed = periods[: n_windows - 1 + last_adjustment[-1]]
+    rates = inflation.reindex(needed)
+    if rates.isna().any():
+        missing = needed[rates.isna().to_numpy()]
+        raise ValueError(f"Inflation data missing for {len(missing)} months, first {missing[0]}")
+
+    # cum_log[i] = log inflation accumulated before month i
+    cum_log = np.concatenate([[0.0], np.cumsum(np.log1p(rates.to_numpy(dtype=float)))])
+    starts = np.arange(n_windows)[:, None]
+    return amount * np.exp(cum_log[starts + last_adjustment] - cum_log[starts])
+
+
+def with_skipped_months(schedule: np.ndarray, skipped: list[int]) -> np.ndarray:
+    """Copy of schedule with no contribution in the given months (0-based)."""
+    result = np.array(schedule, dtype=float)
+    result[..., list(skipped)] = 0.0
+    return result
+
+
+def with_lump_sum(schedule: np.ndarray, amount: float) -> np.ndarray:
+    """Copy of schedule with an extra lump sum invested in the first month."""
+    result = np.array(schedule, dtype=float)
+    result[..., 0] += amount
+    return result
@@ -0,0 +1,335 @@
+import os
+import sys
+import socket
+import struct
+import threading
+import traceback
+from queue import Queue, Empty
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Connection, answer_challenge, deliver_challenge
+
+import pandas as pd
+
+from src.analysis import summarize_windows
+from src.incremental import WINDOW_SIMULATORS
+
+# Environment variable holding the shared secret between coordinator and workers
+AUTHKEY_ENV = "BACKTEST_WORKER_AUTHKEY"
+
+# Seconds to wait for one shard on a socket worker before giving up on it
+DEFAULT_SOCKET_TIMEOUT = 300.0
+
+# Seconds a worker waits for a coordinator to complete the authkey handshake
+HANDSHAKE_TIMEOUT = 30.0
+
+
+def authkey_from_env() -> bytes:
+    """Read the worker authkey from AUTHKEY_ENV; raise if it is not set."""
+    authkey = os.environ.get(AUTHKEY_ENV)
+    if not authkey:
+        raise ValueError(f"No worker authkey: set {AUTHKEY_ENV}")
+    return authkey.encode()
+
+
+def make_shards(
+    series: dict[str, pd.Series],
+    horizons: list[int],
+    monthly_contribution: float = 1000.0,
+    kinds: dict[str, str] | None = None,
+    shard_windows: int = 60,
+) -> list[dict]:
+    """
+    Split rolling window work into (asset, horizon, start range) shards.
+
+    Each shard carries only the slice of the series its windows need, so it
+    can run on any worker without access to the data directory.
+
+    Args:
+        series: {label: monthly prices or growth factors}.
+        horizons: Window lengths in months.
+        monthly_contribution: Amount invested each month.
+        kinds: {label: key of WINDOW_SIMULATORS}; labels default to "price".
+        shard_windows: Maximum number of windows per shard.
+
+    Returns:
+        List of shard dicts with keys: label, kind, window_months,
+        monthly_contribution, start, series.
+    """
+    kinds = kinds or {}
+    shards = []
+    for label, values in series.items():
+        for window_months in horizons:
+            n_windows = len(values) - window_months + 1
+            if n_windows < 1:
+                print(f"Warning: skipping {label} at {window_months} months - only {len(values)} months")
+                continue
+            for start in range(0, n_windows, shard_windows):
+                stop = min(start + shard_windows, n_windows)
+                shards.append({
+                    "label": label,
+                    "kind": kinds.get(label, "price"),
+                    "window_months": window_months,
+                    "monthly_contribution": monthly_contribution,
+                    "start": start,
+                    "series": values.iloc[start : stop + window_months - 1],
+                })
+    return shards
+
+
+def run_shard(shard: dict) -> pd.DataFrame:
+    """Simulate and summarize every window in a shard."""
+    simulate = WINDOW_SIMULATORS[shard["kind"]]
+    invested, values = simulate(shard["series"], shard["monthly_contribution"], shard["window_months"])
+    return summarize_windows(shard["series"].index, invested, values, shard["label"])
+
+
+def merge_shard_results(shards: list[dict], results: list[pd.DataFrame]) -> dict[tuple[str, int], pd.DataFrame]:
+    """
+    Combine shard summaries into one rolling summary per (label, horizon).
+
+    Shards are ordered by start position, so the output does not depend on
+    which worker finished first.
+    """
+    grouped = {}
+    for shard, result in zip(shards, results):
+        grouped.setdefault((shard["label"], shard["window_months"]), []).append((shard["start"], result))
+
+    return {
+        key: pd.concat([df for _, df in sorted(parts, key=lambda p: p[0])], ignore_index=True)
+        for key, parts in grouped.items()
+    }
+
+
+# --- Execution backends ---
+# A backend is a callable (fn, items) -> list with one entry per item: the
+# result of fn(item), or the exception it raised.
+
+
+def serial_map(fn, items: list) -> list:
+    """Run every item in the current process, one after the other."""
+    results = []
+    for item in items:
+        try:
+            results.append(fn(item))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def process_pool_map(fn, items: list, max_workers: int | None = None) -> list:
+    """Run items on a local pool of worker processes."""
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(fn, item) for item in items]
+        return [f.exception() or f.result() for f in futures]
+
+
+def _set_io_timeout(sock: socket.socket, timeout: float | None):
+    """
+    Limit every blocking send/recv on sock to timeout seconds (None: no limit).
+
+    Unlike sock.settimeout(), this keeps the descriptor blocking, so it still
+    works once the socket is wrapped in a multiprocessing Connection; an
+    expired wait surfaces as an OSError.
+    """
+    timeout = timeout or 0
+    if sys.platform == "win32":
+        value = struct.pack("I", int(timeout * 1000))
+    else:
+        value = struct.pack("ll", int(timeout), int(timeout % 1 * 1_000_000))
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, value)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDTIMEO, value)
+
+
+def _connect(address: tuple[str, int], authkey: bytes, timeout: float | None) -> Connection:
+    """Open an authenticated connection to a worker, bounding connect and handshake by timeout."""
+    sock = socket.create_connection(address, timeout=timeout)
+    sock.settimeout(None)
+    _set_io_timeout(sock, timeout)
+    conn = Connection(sock.detach())
+    try:
+        answer_challenge(conn, authkey)
+        deliver_challenge(conn, authkey)
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+def socket_map(
+    fn,
+    items: list,
+    addresses: list[tuple[str, int]],
+    authkey: bytes,
+    timeout: float | None = DEFAULT_SOCKET_TIMEOUT,
+) -> list:
+    """
+    Run items on remote workers started with serve_worker().
+
+    Each worker address gets one connection that pulls items from a shared
+    queue until it is empty. timeout bounds the connect and authkey
+    handshake, each item's run, and every individual send/recv. A worker
+    that cannot be reached, drops its connection or exceeds timeout stops
+    receiving items; its in-flight item is reported as failed so the caller
+    can retry it. timeout=None waits forever, so a hung worker blocks the
+    whole run.
+
+    Raises AuthenticationError if any worker rejects the authkey, since
+    retrying cannot fix a configuration error.
+    """
+    if not authkey:
+        raise ValueError("socket_map requires the workers' authkey")
+
+    pending = object()
+    results = [pending] * len(items)
+    queue = Queue()
+    for i in range(len(items)):
+        queue.put(i)
+    auth_errors = []
+    connect_errors = []
+
+    def drive(address):
+        try:
+            conn = _connect(address, authkey, timeout)
+        except AuthenticationError as e:
+            auth_errors.append(f"{address[0]}:{address[1]} ({e})")
+            return
+        except (OSError, EOFError) as e:
+            connect_errors.append(f"{address[0]}:{address[1]} ({e!r})")
+            return
+        with conn:
+            while True:
+                try:
+                    i = queue.get_nowait()
+                except Empty:
+                    return
+                try:
+                    conn.send((fn, items[i]))
+                    if timeout is not None and not conn.poll(timeout):
+                        results[i] = TimeoutError(f"Worker {address} timed out after {timeout}s")
+                        return
+                    status, payload = conn.recv()
+                except (OSError, EOFError) as e:
+                    results[i] = ConnectionError(f"Worker {address} failed: {e!r}")
+                    return
+                results[i] = payload if status == "ok" else RuntimeError(f"Worker {address} raised:\n{payload}")
+
+    threads = [threading.Thread(target=drive, args=(address,), daemon=True) for address in addresses]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    if auth_errors:
+        raise AuthenticationError(f"Workers rejected the authkey: {', '.join(auth_errors)}")
+
+    unavailable = "No worker available"
+    if connect_errors:
+        unavailable += f"; could not connect to {', '.join(connect_errors)}"
+    return [
+        ConnectionError(unavailable) if r is pending else r
+        for r in results
+    ]
+
+
+def _handle_connection(sock: socket.socket, authkey: bytes):
+    """Authenticate one coordinator connection, then serve its (fn, item) requests until it closes."""
+    family = sock.family
+    _set_io_timeout(sock, HANDSHAKE_TIMEOUT)
+    with Connection(sock.detach()) as conn:
+        try:
+            deliver_challenge(conn, authkey)
+            answer_challenge(conn, authkey)
+        except (OSError, EOFError, AuthenticationError):
+            # Wrong authkey, port probe or a client that never answered
+            return
+
+        # Authenticated coordinators may take any time between items
+        with socket.fromfd(conn.fileno(), family, socket.SOCK_STREAM) as dup:
+            _set_io_timeout(dup, None)
+
+        while True:
+            try:
+                fn, item = conn.recv()
+            except (EOFError, OSError):
+                return
+            try:
+                reply = ("ok", fn(item))
+            except Exception:
+                reply = ("error", traceback.format_exc())
+            try:
+                conn.send(reply)
+            except OSError:
+                return
+
+
+def serve_worker(address: tuple[str, int], authkey: bytes):
+    """
+    Accept coordinator connections on address and run the items they send.
+
+    Items are unpickled and executed, so the authkey is the only thing
+    stopping anyone who can reach the port from running code on this host.
+    Each connection is authenticated on its own thread, with a
+    HANDSHAKE_TIMEOUT limit, so a silent client cannot block the others.
+    """
+    if not authkey:
+        raise ValueError("serve_worker requires an authkey")
+
+    with socket.create_server(address) as server:
+        print(f"Worker listening on {address[0]}:{address[1]}", flush=True)
+        while True:
+            try:
+                sock, _ = server.accept()
+            except OSError:
+                continue
+            threading.Thread(target=_handle_connection, args=(sock, authkey), daemon=True).start()
+
+
+def run_sharded_rolling(
+    series: dict[str, pd.Series],
+    horizons: list[int],
+    monthly_contribution: float = 1000.0,
+    kinds: dict[str, str] | None = None,
+    backend=serial_map,
+    shard_windows: int = 60,
+    retries: int = 2,
+) -> dict[tuple[str, int], pd.DataFrame]:
+    """
+    Rolling summaries for every (asset, horizon), computed in shards on a backend.
+
+    Failed shards are resubmitted up to `retries` times. A shard only counts
+    as failed once the backend reports it, so socket backends need a finite
+    per-shard timeout (socket_map defaults to DEFAULT_SOCKET_TIMEOUT) for
+    hung or silently disconnected workers to be retried. Errors the backend
+    raises instead of reporting (e.g. a rejected authkey) are not retried.
+    Use functools.partial to configure a backend, e.g.
+    partial(socket_map, addresses=[("127.0.0.1", 6001)], authkey=authkey_from_env()).
+
+    Returns {(label, window_months): rolling summary DataFrame}, matching
+    rolling_summary() for each pair.
+    """
+    shards = make_shards(series, horizons, monthly_contribution, kinds, shard_windows)
+    results = [None] * len(shards)
+    pending = list(range(len(shards)))
+
+    for attempt in range(retries + 1):
+        outcomes = backend(run_shard, [shards[i] for i in pending])
+        failed = []
+        for i, outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                failed.append((i, outcome))
+            else:
+                results[i] = outcome
+        pending = [i for i, _ in failed]
+        if not pending:
+            break
+        print(f"  {len(pending)} shards failed on attempt {attempt + 1}")
+    else:
+        i, error = failed[0]
+        shard = shards[i]
+        raise RuntimeError(
+            f"{len(failed)} shards failed after {retries + 1} attempts; "
+            f"first: {shard['label']} {shard['window_months']}m from window {shard['start']}: {error}"
+        )
+
+    return merge_shard_results(shards, results)
@@ -1,10 +1,49 @@
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.analysis import summarize_windows
+
+
+def contribution_vector(monthly_contribution, months: int) -> np.ndarray:
+    """
+    Expand a contribution amount or schedule into one value per month.
+
+    Accepts a single amount (invested every month) or a sequence of
+    exactly `months` amounts.
+    """
+    contributions = np.asarray(monthly_contribution, dtype=float)
+    if contributions.ndim > 1 or (contributions.ndim == 1 and len(contributions) != months):
+        raise ValueError(
+            f"Contribution schedule has shape {contributions.shape}, expected ({months},)"
+        )
+    return np.broadcast_to(contributions, (months,))
+
+
+def contribution_matrix(monthly_contribution, n_windows: int, window_months: int) -> np.ndarray:
+    """
+    Expand contributions to one schedule per rolling window.
+
+    Accepts a single amount, a (window_months,) schedule shared by all
+    windows, or an array whose last two axes are (n_windows, window_months);
+    any leading axes (e.g. one per schedule) are kept.
+    """
+    contributions = np.asarray(monthly_contribution, dtype=float)
+    try:
+        shape = np.broadcast_shapes(contributions.shape, (n_windows, window_months))
+    except ValueError:
+        shape = None
+    if shape is None or shape[-2:] != (n_windows, window_months):
+        raise ValueError(
+            f"Contribution schedule has shape {contributions.shape}, "
+            f"expected ({window_months},) or ({n_windows}, {window_months})"
+        )
+    return np.broadcast_to(contributions, shape)
 
 
 def simulate_dca(
     prices: pd.Series,
-    monthly_contribution: float = 1000.0,
+    monthly_contribution: float | np.ndarray = 1000.0,
     months: int = 120,
 ) -> pd.DataFrame:
     """
@@ -12,7 +51,8 @@ def simulate_dca(
 
     Args:
         prices: Monthly closing prices (DatetimeIndex).
-        monthly_contribution: Amount invested each month.
+        monthly_contribution: Amount invested each month, or a schedule with
+            one amount per month (see src.schedules).
         months: Number of months to invest.
 
     Returns:
@@ -25,44 +65,99 @@ def simulate_dca(
         )
 
     prices = prices.iloc[:months]
-    records = []
-    total_shares = 0.0
-    total_invested = 0.0
-
-    for date, price in prices.items():
-        shares_bought = monthly_contribution / price
-        total_shares += shares_bought
-        total_invested += monthly_contribution
-        portfolio_value = total_shares * price
+    contributions = contribution_vector(monthly_contribution, months)
+    price_values = prices.to_numpy(dtype=float)
 
-        records.append({
-            "date": date,
-            "price": price,
-            "shares_bought": shares_bought,
-            "total_shares": total_shares,
-            "total_invested": total_invested,
-            "portfolio_value": portfolio_value,
-        })
+    shares_bought = contributions / price_values
+    total_shares = np.cumsum(shares_bought)
 
-    return pd.DataFrame(records)
+    return pd.DataFrame({
+        "date": prices.index,
+        "price": price_values,
+        "shares_bought": shares_bought,
+        "total_shares": total_shares,
+        "total_invested": np.cumsum(contributions),
+        "portfolio_value": total_shares * price_values,
+    })
 
 
 def run_rolling_windows(
     prices: pd.Series,
-    monthly_contribution: float = 1000.0,
+    monthly_contribution: float | np.ndarray = 1000.0,
     window_months: int = 120,
 ) -> list[pd.DataFrame]:
     """
     Run DCA simulation for every possible rolling window of window_months.
 
+    monthly_contribution may be an amount, a schedule shared by all windows,
+    or one schedule per window with shape (n_windows, window_months).
+
     Returns a list of simulation DataFrames, one per starting month.
     """
     results = []
     max_start = len(prices) - window_months
+    contributions = contribution_matrix(monthly_contribution, max(max_start + 1, 0), window_months)
 
     for start in range(max_start + 1):
         window_prices = prices.iloc[start : start + window_months]
-        sim = simulate_dca(window_prices, monthly_contribution, window_months)
+        sim = simulate_dca(window_prices, contributions[start], window_months)
         results.append(sim)
 
     return results
+
+
+def simulate_dca_windows(
+    prices: pd.Series,
+    monthly_contribution: float | np.ndarray = 1000.0,
+    window_months: int = 120,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate DCA for every rolling window at once.
+
+    Holdings are a contribution-weighted cumulative sum of 1 / price over
+    each window, so there is no per-window or per-month loop.
+
+    Args:
+        prices: Monthly closing prices (DatetimeIndex).
+        monthly_contribution: Anything contribution_matrix() accepts; leading
+            axes evaluate several schedules in one pass.
+        window_months: Number of months per window.
+
+    Returns:
+        (invested, values), both shaped (..., n_windows, window_months).
+    """
+    if len(prices) < window_months:
+        raise ValueError(
+            f"Price series has {len(prices)} months, need at least {window_months}"
+        )
+
+    windows = sliding_window_view(prices.to_numpy(dtype=float), window_months)
+    contributions = contribution_matrix(monthly_contribution, len(windows), window_months)
+
+    invested = np.cumsum(contributions, axis=-1)
+    values = np.cumsum(contributions / windows, axis=-1) * windows
+    return invested, values
+
+
+def run_rolling_schedules(
+    prices: pd.Series,
+    schedules: dict[str, float | np.ndarray],
+    window_months: int = 120,
+) -> dict[str, pd.DataFrame]:
+    """
+    Evaluate many contribution schedules across all rolling windows in one batch.
+
+    Returns {schedule label: rolling summary DataFrame}, with the same
+    columns as rolling_summary().
+    """
+    n_windows = max(len(prices) - window_months + 1, 0)
+    stacked = np.stack([
+        contribution_matrix(schedule, n_windows, window_months)
+        for schedule in schedules.values()
+    ])
+    invested, values = simulate_dca_windows(prices, stacked, window_months)
+
+    return {
+        label: summarize_windows(prices.index, invested[i], values[i], label)
+        for i, label in enumerate(schedules)
+    }
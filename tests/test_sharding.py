@@ -0,0 +1,158 @@
+"""
+Sharded execution checks against localhost workers.
+
+Starts worker.py on free localhost ports and compares run_sharded_rolling()
+with the per-window rolling_summary() path. Run with: python -m pytest tests
+"""
+
+import os
+import sys
+import time
+import signal
+import socket
+import threading
+import subprocess
+from functools import partial
+from multiprocessing import AuthenticationError
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis import rolling_summary
+from src.simulator import run_rolling_windows
+from src.sharding import process_pool_map, run_sharded_rolling, socket_map
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+AUTHKEY = b"test-authkey"
+WINDOW_MONTHS = 24
+
+
+def _prices(n_months: int, seed: int) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2000-01-01", periods=n_months, freq="MS")
+    return pd.Series(100 * np.cumprod(1 + rng.normal(0.005, 0.04, n_months)), index=dates)
+
+
+SERIES = {"Asset A": _prices(120, 1), "Asset B": _prices(90, 2)}
+
+
+def _expected() -> dict[tuple[str, int], pd.DataFrame]:
+    return {
+        (label, WINDOW_MONTHS): rolling_summary(run_rolling_windows(prices, 1000.0, WINDOW_MONTHS), label)
+        for label, prices in SERIES.items()
+    }
+
+
+def _assert_matches(results):
+    expected = _expected()
+    assert list(results) == list(expected)
+    for key, df in expected.items():
+        pd.testing.assert_frame_equal(results[key], df, check_dtype=False)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_for_port(port: int, deadline: float = 30.0):
+    end = time.monotonic() + deadline
+    while time.monotonic() < end:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Worker on port {port} did not start")
+
+
+def _run_with_deadline(fn, deadline: float = 30.0):
+    """Run fn on a thread and fail the test if it does not return by deadline."""
+    outcome = {}
+    thread = threading.Thread(target=lambda: outcome.update(result=fn()), daemon=True)
+    thread.start()
+    thread.join(timeout=deadline)
+    assert not thread.is_alive(), f"Did not return within {deadline}s"
+    return outcome["result"]
+
+
+@pytest.fixture
+def workers():
+    """Start three localhost workers; yields [(process, address), ...]."""
+    env = dict(os.environ, BACKTEST_WORKER_AUTHKEY=AUTHKEY.decode())
+    started = []
+    for _ in range(3):
+        port = _free_port()
+        proc = subprocess.Popen(
+            [sys.executable, "worker.py", "--port", str(port)],
+            cwd=ROOT, env=env, stdout=subprocess.DEVNULL,
+        )
+        started.append((proc, ("127.0.0.1", port)))
+    for _, (_, port) in started:
+        _wait_for_port(port)
+
+    yield started
+
+    for proc, _ in started:
+        if hasattr(signal, "SIGCONT"):
+            proc.send_signal(signal.SIGCONT)
+        proc.kill()
+        proc.wait()
+
+
+def test_serial_matches_rolling_summary():
+    _assert_matches(run_sharded_rolling(SERIES, [WINDOW_MONTHS], shard_windows=7))
+
+
+def test_process_pool_matches_rolling_summary():
+    backend = partial(process_pool_map, max_workers=2)
+    _assert_matches(run_sharded_rolling(SERIES, [WINDOW_MONTHS], backend=backend, shard_windows=7))
+
+
+def test_socket_survives_worker_killed_mid_run(workers):
+    addresses = [address for _, address in workers]
+    backend = partial(socket_map, addresses=addresses, authkey=AUTHKEY, timeout=10)
+    victim = workers[0][0]
+
+    attempts = []
+
+    def killing_backend(fn, items):
+        # Kill one worker shortly after the first attempt starts
+        if not attempts:
+            threading.Timer(0.2, victim.kill).start()
+        attempts.append(len(items))
+        return backend(fn, items)
+
+    results = run_sharded_rolling(SERIES, [WINDOW_MONTHS], backend=killing_backend, shard_windows=1)
+    _assert_matches(results)
+    assert victim.wait(timeout=5) is not None
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGSTOP"), reason="needs SIGSTOP")
+def test_socket_retries_around_hung_worker(workers):
+    hung = workers[0][0]
+    hung.send_signal(signal.SIGSTOP)
+    addresses = [address for _, address in workers]
+    backend = partial(socket_map, addresses=addresses, authkey=AUTHKEY, timeout=3)
+
+    results = _run_with_deadline(lambda: run_sharded_rolling(SERIES, [WINDOW_MONTHS], backend=backend))
+    _assert_matches(results)
+
+
+def test_socket_wrong_authkey_raises(workers):
+    addresses = [address for _, address in workers]
+    backend = partial(socket_map, addresses=addresses, authkey=b"wrong", timeout=5)
+    with pytest.raises(AuthenticationError):
+        run_sharded_rolling(SERIES, [WINDOW_MONTHS], backend=backend)
+
+
+def test_silent_client_does_not_block_worker(workers):
+    _, address = workers[0]
+    with socket.create_connection(address):
+        # Connected but never answering the handshake challenge
+        results = _run_with_deadline(
+            lambda: socket_map(len, [[1, 2], [3]], [address], authkey=AUTHKEY, timeout=5)
+        )
+    assert results == [2, 1]
@@ -0,0 +1,33 @@
+"""
+Sharded backtest worker
+
+Serves rolling window shards sent by run_sharded_rolling() with the
+socket_map backend. Workers run whatever code they are sent, so a shared
+secret is required, passed with --authkey or the BACKTEST_WORKER_AUTHKEY
+environment variable. Start one per core or host, e.g.:
+
+    BACKTEST_WORKER_AUTHKEY=my-secret python worker.py --port 6001
+    BACKTEST_WORKER_AUTHKEY=my-secret python worker.py --host 0.0.0.0 --port 6001
+"""
+
+import os
+import argparse
+
+from src.sharding import AUTHKEY_ENV, serve_worker
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a backtest shard worker.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6001)
+    parser.add_argument("--authkey", default=os.environ.get(AUTHKEY_ENV), help=f"defaults to ${AUTHKEY_ENV}")
+    args = parser.parse_args()
+
+    if not args.authkey:
+        parser.error(f"an authkey is required: pass --authkey or set {AUTHKEY_ENV}")
+
+    serve_worker((args.host, args.port), authkey=args.authkey.encode())
+
+
+if __name__ == "__main__":
+    main()